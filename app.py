@@ -1,13 +1,40 @@
 #!/usr/bin/env python3
 
-import re
+import functools
 import sys
-from typing import Any, List, Tuple, Union
-from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, List, Sequence, Tuple, Union
 
-class AbstractCronExpression(ABC):
-    def __init__(self, expression: str):
-        parts = expression.split()
+_MIN_OPTS = tuple(range(60))
+_HOUR_OPTS = tuple(range(24))
+_DOM_OPTS = tuple(range(1, 32))
+_MON_OPTS = tuple(range(1, 13))
+_DOW_OPTS = tuple(range(1, 8))
+
+class AbstractCronExpression:
+    __slots__ = (
+        "raw_minute",
+        "raw_hour",
+        "raw_day_of_month",
+        "raw_month",
+        "raw_day_of_week",
+        "command",
+        "minute",
+        "hour",
+        "day_of_month",
+        "month",
+        "day_of_week"
+    )
+    
+    # Set by subclasses: the raw field strings or their expanded values.
+    minute: Union[str, array]
+    hour: Union[str, array]
+    day_of_month: Union[str, array]
+    month: Union[str, array]
+    day_of_week: Union[str, array]
+    
+    def __init__(self, expression: Union[str, List[str]]):
+        parts = expression.split() if isinstance(expression, str) else expression
         if len(parts) < 6:
             raise ValueError("Invalid cron expression format. Expected at least 6 parts.")
         
@@ -18,32 +45,7 @@ class AbstractCronExpression(ABC):
         self.raw_day_of_week = parts[4]
         self.command = " ".join(parts[5:])
         
-    @property
-    @abstractmethod
-    def minute(self):
-        pass
-    
-    @property
-    @abstractmethod
-    def hour(self):
-        pass
-    
-    @property
-    @abstractmethod
-    def day_of_month(self):
-        pass
-    
-    @property
-    @abstractmethod
-    def month(self):
-        pass
-    
-    @property
-    @abstractmethod
-    def day_of_week(self):
-        pass
-    
-    def to_table_format(self) -> List[Tuple[str, Union[str, List[Any]]]]:
+    def to_table_format(self) -> List[Tuple[str, Union[str, array]]]:
         return [
             ("minute", self.minute),
             ("hour", self.hour),
@@ -54,132 +56,152 @@ class AbstractCronExpression(ABC):
         ]
 
 class RawCronExpression(AbstractCronExpression):
-    @property
-    def minute(self):
-        return self.raw_minute
+    __slots__ = ()
     
-    @property
-    def hour(self):
-        return self.raw_hour
-    
-    @property
-    def day_of_month(self):
-        return self.raw_day_of_month
-    
-    @property
-    def month(self):
-        return self.raw_month
-    
-    @property
-    def day_of_week(self):
-        return self.raw_day_of_week
+    def __init__(self, expression: Union[str, List[str]]):
+        super().__init__(expression)
+        
+        self.minute = self.raw_minute
+        self.hour = self.raw_hour
+        self.day_of_month = self.raw_day_of_month
+        self.month = self.raw_month
+        self.day_of_week = self.raw_day_of_week
     
     def expand(self):
-        return CronExpression(
-            f"{self.minute} {self.hour} {self.day_of_month} {self.month} {self.day_of_week} {self.command}"
-        )
+        return CronExpression([
+            self.raw_minute,
+            self.raw_hour,
+            self.raw_day_of_month,
+            self.raw_month,
+            self.raw_day_of_week,
+            self.command
+        ])
     
     
         
 class CronExpression(AbstractCronExpression):
-    def __init__(self, expression: str):
+    __slots__ = ()
+    
+    def __init__(self, expression: Union[str, List[str]]):
         super().__init__(expression)
         
-        self._minute = expand_expression(self.raw_minute, list(range(60)))
-        self._hour = expand_expression(self.raw_hour, list(range(24)))
-        self._day_of_month = expand_expression(self.raw_day_of_month, list(range(1, 32)))
-        self._month = expand_expression(self.raw_month, list(range(1, 13)))
-        self._day_of_week = expand_expression(self.raw_day_of_week, list(range(1, 8)))
-    
-    @property
-    def minute(self):
-        return self._minute
-    
-    @property
-    def hour(self):
-        return self._hour
-    
-    @property
-    def day_of_month(self):
-        return self._day_of_month
-    
-    @property
-    def month(self):
-        return self._month
-    
-    @property
-    def day_of_week(self):
-        return self._day_of_week
+        # Every expanded value fits in a byte, so store them unboxed.
+        self.minute = array("B", _expand_cached(self.raw_minute, 0))
+        self.hour = array("B", _expand_cached(self.raw_hour, 1))
+        self.day_of_month = array("B", _expand_cached(self.raw_day_of_month, 2))
+        self.month = array("B", _expand_cached(self.raw_month, 3))
+        self.day_of_week = array("B", _expand_cached(self.raw_day_of_week, 4))
         
 
-def expand_expression(expression: str, options: List[int]) -> List[int]:
+def _parse_value(token: str, expression: str) -> int:
+    """Parse a one or two digit cron value."""
+    if not (0 < len(token) <= 2 and all("0" <= c <= "9" for c in token)):
+        raise ValueError(f"unrecognized expression format: {expression}")
+    return int(token)
+
+
+def _is_contiguous(options: Sequence[int]) -> bool:
+    """Whether options are known to be a non-empty, unbroken run of integers."""
+    if isinstance(options, range):
+        return options.step == 1 and len(options) > 0
+    return any(options is field_options for field_options in _RANGES)
+
+
+def expand_expression(expression: str, options: Sequence[int]) -> List[int]:
     
     if expression == "*":
-        return options
+        return list(options)
 
+    if "/" in expression:
+        base_expression, _, step = expression.partition("/")
+        if base_expression != "*" and "-" not in base_expression:
+            raise ValueError(f"unrecognized expression format: {expression}")
+        interval = _parse_value(step, expression)
+        if interval <= 0:
+            raise ValueError(f"Invalid interval in expression: {expression}")
+        
+        new_options = expand_expression(base_expression, options)
+        if _is_contiguous(options):
+            # The base expansion is contiguous too, so stepping by value is slicing.
+            return new_options[::interval]
+        return [x for x in new_options if (x - new_options[0]) % interval == 0]
     
-    dash_matches = re.search(r"^(\d{1,2})-(\d{1,2})$", expression)
-    if dash_matches:
-        start, end = int(dash_matches.group(1)), int(dash_matches.group(2))
+    if "-" in expression:
+        start_token, _, end_token = expression.partition("-")
+        start, end = _parse_value(start_token, expression), _parse_value(end_token, expression)
         if start > end:
             raise ValueError(f"Invalid range in expression: {expression}")
+        if _is_contiguous(options):
+            # Contiguous options: intersect the bounds instead of scanning.
+            lo, hi = max(start, options[0]), min(end, options[-1])
+            return list(range(lo, hi + 1))
         return [x for x in options if start <= x <= end]
     
-    if re.match(r"^\d{1,2}(?:,\d{1,2})*$", expression):
-        values = [int(x) for x in expression.split(",")]
-        # print(values)
-        res_val = [x for x in values if x in options]
+    opt_set = options if isinstance(options, (set, frozenset)) else frozenset(options)
+    
+    if "," in expression:
+        values = [_parse_value(x, expression) for x in expression.split(",")]
+        res_val = [x for x in values if x in opt_set]
         if res_val:
             return res_val
         else:
             raise ValueError(f"Value {values} not in valid options for this component")
     
-    interval_matches = re.search(r"^(\*|\d{1,2}-\d{1,2})/(\d{1,2})$", expression)
-    
-    if interval_matches:
-        base_expression = interval_matches.group(1)
-        interval = int(interval_matches.group(2))
-        if interval <= 0:
-            raise ValueError(f"Invalid interval in expression: {expression}")
-        
-        new_options = expand_expression(base_expression, options)
-        # return new_options[::interval]
-        return [x for x in new_options if (x - new_options[0]) % interval == 0]
-    
-    if re.match(r"^\d{1,2}$", expression):
-        value = int(expression)
-        if value in options:
-            return [value]
-        else:
-            raise ValueError(f"Value {value} not in valid options for this component")
-    
-    
-    raise ValueError(f"unrecognized expression format: {expression}")
+    value = _parse_value(expression, expression)
+    if value in opt_set:
+        return [value]
+    else:
+        raise ValueError(f"Value {value} not in valid options for this component")
+
+
+_RANGES = (_MIN_OPTS, _HOUR_OPTS, _DOM_OPTS, _MON_OPTS, _DOW_OPTS)
+
+# Tokens that make up most real crontabs, expanded once per field kind.
+_COMMON_TOKENS = (
+    "*", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
+    "*/2", "*/5", "*/10", "*/15", "*/30", "0-12", "1-5"
+)
+
+_FAST_CACHE: Dict[Tuple[str, int], Tuple[int, ...]] = {}
+for _kind, _options in enumerate(_RANGES):
+    for _token in _COMMON_TOKENS:
+        try:
+            _FAST_CACHE[(_token, _kind)] = tuple(expand_expression(_token, _options))
+        except ValueError:
+            pass
+del _kind, _options, _token
+
+
+@functools.lru_cache(maxsize=512)
+def _expand_cached(expression: str, kind: int) -> Tuple[int, ...]:
+    """Expand a field against the options of the given kind, memoized."""
+    hit = _FAST_CACHE.get((expression, kind))
+    if hit is not None:
+        return hit
+    return tuple(expand_expression(expression, _RANGES[kind]))
 
 
 class TableOutput:
+    __slots__ = ("name_col_length", "_rows")
+    
     def __init__(
         self,
-        table_data: List[Tuple[str, Union[str, List[int]]]],
+        table_data: List[Tuple[str, Union[str, List[int], array]]],
         name_col_length: int = 14
     ):
-        self.table_data = table_data
         self.name_col_length = name_col_length
+        self._rows = [
+            (name, " ".join(map(str, value)) if isinstance(value, (list, array)) else value)
+            for name, value in table_data
+        ]
     
     def render(self) -> str:
-        out = ""
-        for name, value in self.table_data:
-            if isinstance(value, list):
-                value = " ".join([str(x) for x in value])
-            row = f"{self._generate_buffered_col(name, self.name_col_length)} {value}\n"
-            out += row
-        return out.rstrip()
-    
-    def _generate_buffered_col(self, name: str, length: int) -> str:
-        """Generate a column with padding."""
-        return name + " " * (length - len(name))
+        return "\n".join(
+            f"{name.ljust(self.name_col_length)} {value}" for name, value in self._rows
+        ).rstrip()
 
 
+@functools.lru_cache(maxsize=256)
 def expand_cron_exp(cron_exp: str) -> str:
     table_data = RawCronExpression(cron_exp).expand().to_table_format()
     return TableOutput(table_data).render()
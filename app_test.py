@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import unittest
 import sys
+from array import array
 from io import StringIO
 from unittest.mock import patch
 
@@ -9,7 +10,9 @@ from app import (
     CronExpression, 
     RawCronExpression, 
     expand_expression, 
-    TableOutput
+    TableOutput,
+    _FAST_CACHE,
+    _expand_cached
 )
 
 class TestExpandExpression(unittest.TestCase):
@@ -33,6 +36,26 @@ class TestExpandExpression(unittest.TestCase):
         options = list(range(1, 6))
         result = expand_expression("2-4", options)
         self.assertEqual(result, [2, 3, 4])
+    
+    def test_range_clipped_to_options(self):
+        self.assertEqual(expand_expression("0-5", tuple(range(1, 32))), [1, 2, 3, 4, 5])
+        self.assertEqual(expand_expression("20-40", tuple(range(24))), [20, 21, 22, 23])
+        self.assertEqual(expand_expression("30-40", tuple(range(24))), [])
+        self.assertEqual(expand_expression("0-5", range(1, 32)), [1, 2, 3, 4, 5])
+        self.assertEqual(expand_expression("20-40", range(24)), [20, 21, 22, 23])
+    
+    def test_range_with_non_contiguous_options(self):
+        options = [1, 2, 4, 5, 7, 8, 10]
+        result = expand_expression("3-8", options)
+        self.assertEqual(result, [4, 5, 7, 8])
+    
+    def test_range_with_duplicate_options(self):
+        result = expand_expression("0-2", [0, 2, 2])
+        self.assertEqual(result, [0, 2, 2])
+    
+    def test_range_with_frozenset_options(self):
+        result = expand_expression("1-3", frozenset(range(1, 6)))
+        self.assertEqual(sorted(result), [1, 2, 3])
         
     
     def test_interval(self):
@@ -46,6 +69,15 @@ class TestExpandExpression(unittest.TestCase):
         result = expand_expression("2-8/2", options)
         self.assertEqual(result, [2, 4, 6, 8])
     
+    def test_interval_with_non_contiguous_options(self):
+        options = [1, 2, 4, 5, 7, 8, 10]
+        self.assertEqual(expand_expression("*/5", options), [1])
+        self.assertEqual(expand_expression("*/7", options), [1, 8])
+        self.assertEqual(expand_expression("1-10/3", options), [1, 4, 7, 10])
+        self.assertEqual(expand_expression("*/2", [0, 2, 2]), [0, 2, 2])
+        self.assertEqual(sorted(expand_expression("*/2", frozenset(range(1, 6)))), [1, 3, 5])
+        self.assertEqual(expand_expression("*/2", range(1, 10)), [1, 3, 5, 7, 9])
+    
     def test_invalid_value(self):
         options = list(range(1, 6))
         with self.assertRaises(ValueError):
@@ -65,33 +97,68 @@ class TestExpandExpression(unittest.TestCase):
         options = list(range(1, 6))
         with self.assertRaises(ValueError):
             expand_expression("a", options)
+    
+    def test_common_token_with_custom_options_is_validated(self):
+        options = [1, 2, 3]
+        self.assertEqual(expand_expression("*", options), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            expand_expression("5", options)
+    
+    def test_malformed_expressions(self):
+        options = list(range(1, 6))
+        for expression in ["1-3,5", "3/2", "1,,2", "*/", "-3", "123", "\u0663"]:
+            with self.assertRaises(ValueError):
+                expand_expression(expression, options)
+
+
+class TestExpandCached(unittest.TestCase):
+    
+    def test_common_token_uses_fast_cache(self):
+        _expand_cached.cache_clear()
+        self.assertIs(_expand_cached("*/15", 0), _FAST_CACHE[("*/15", 0)])
+        self.assertEqual(_expand_cached("*/15", 0), (0, 15, 30, 45))
+    
+    def test_uncommon_token_is_expanded(self):
+        self.assertNotIn(("1-3", 1), _FAST_CACHE)
+        self.assertEqual(_expand_cached("1-3", 1), (1, 2, 3))
 
 
 class TestCronExpression(unittest.TestCase):
     
     def test_init(self):
         cron = CronExpression("0 0 1 1 1 /usr/bin/find")
-        self.assertEqual(cron.minute, [0])
-        self.assertEqual(cron.hour, [0])
-        self.assertEqual(cron.day_of_month, [1])
-        self.assertEqual(cron.month, [1])
-        self.assertEqual(cron.day_of_week, [1])
+        self.assertEqual(cron.minute.tolist(), [0])
+        self.assertEqual(cron.hour.tolist(), [0])
+        self.assertEqual(cron.day_of_month.tolist(), [1])
+        self.assertEqual(cron.month.tolist(), [1])
+        self.assertEqual(cron.day_of_week.tolist(), [1])
         self.assertEqual(cron.command, "/usr/bin/find")
     
     def test_init_with_complex_expression(self):
         cron = CronExpression("*/5 0-12 1,15 */2 1-5 /usr/bin/find")
-        self.assertEqual(cron.minute, [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
-        self.assertEqual(cron.hour, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
-        self.assertEqual(cron.day_of_month, [1, 15])
-        self.assertEqual(cron.month, [1, 3, 5, 7, 9, 11])
-        self.assertEqual(cron.day_of_week, [1, 2, 3, 4, 5])
+        self.assertEqual(cron.minute.tolist(), [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
+        self.assertEqual(cron.hour.tolist(), [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+        self.assertEqual(cron.day_of_month.tolist(), [1, 15])
+        self.assertEqual(cron.month.tolist(), [1, 3, 5, 7, 9, 11])
+        self.assertEqual(cron.day_of_week.tolist(), [1, 2, 3, 4, 5])
         self.assertEqual(cron.command, "/usr/bin/find")
     
+    def test_init_with_split_parts(self):
+        cron = CronExpression(["*/30", "0", "1", "1", "1", "/usr/bin/find -a"])
+        self.assertEqual(cron.minute.tolist(), [0, 30])
+        self.assertEqual(cron.command, "/usr/bin/find -a")
+    
+    def test_repeated_fields_are_independent(self):
+        first = CronExpression("*/15 0 1 1 1 /usr/bin/find")
+        first.minute.append(99)
+        second = CronExpression("*/15 0 1 1 1 /usr/bin/find")
+        self.assertEqual(second.minute.tolist(), [0, 15, 30, 45])
+    
     def test_to_table_format(self):
         cron = CronExpression("0 0 1 1 1 /usr/bin/find")
         table = cron.to_table_format()
         self.assertEqual(len(table), 6)
-        self.assertEqual(table[0], ("minute", [0]))
+        self.assertEqual(table[0], ("minute", array("B", [0])))
         self.assertEqual(table[5], ("command", "/usr/bin/find"))
     
     def test_invalid_expression(self):
@@ -113,11 +180,11 @@ class TestRawCronExpression(unittest.TestCase):
     def test_expand(self):
         raw = RawCronExpression("*/5 0-12 1,15 */2 1-5 /usr/bin/find")
         expanded = raw.expand()
-        self.assertEqual(expanded.minute, [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
-        self.assertEqual(expanded.hour, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
-        self.assertEqual(expanded.day_of_month, [1, 15])
-        self.assertEqual(expanded.month, [1, 3, 5, 7, 9, 11])
-        self.assertEqual(expanded.day_of_week, [1, 2, 3, 4, 5])
+        self.assertEqual(expanded.minute.tolist(), [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
+        self.assertEqual(expanded.hour.tolist(), [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+        self.assertEqual(expanded.day_of_month.tolist(), [1, 15])
+        self.assertEqual(expanded.month.tolist(), [1, 3, 5, 7, 9, 11])
+        self.assertEqual(expanded.day_of_week.tolist(), [1, 2, 3, 4, 5])
         self.assertEqual(expanded.command, "/usr/bin/find")
     
     def test_invalid_expression(self):
@@ -148,6 +215,18 @@ class TestExpandCronExp(unittest.TestCase):
         """Test that an invalid expression raises a ValueError."""
         with self.assertRaises(ValueError):
             expand_cron_exp("0 0 1 1")  # Missing parts
+    
+    def test_repeated_expression_is_cached(self):
+        expand_cron_exp.cache_clear()
+        first = expand_cron_exp("*/20 1 1 1 1 /usr/bin/find")
+        second = expand_cron_exp("*/20 1 1 1 1 /usr/bin/find")
+        self.assertIs(first, second)
+        self.assertEqual(expand_cron_exp.cache_info().hits, 1)
+    
+    def test_invalid_expression_raises_every_call(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                expand_cron_exp("99 0 1 1 1 /usr/bin/find")
 
 
 class TestMain(unittest.TestCase):